@@ -1,153 +1,576 @@
 import sys
 import os
-import yt_dlp
+import re
+import time
+import asyncio
+import importlib
+import threading
+from pathlib import Path
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QTextEdit, QPushButton, QComboBox, 
-                             QLabel, QFileDialog, QProgressBar, QMessageBox,
-                             QFrame, QScrollArea, QGroupBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                             QHBoxLayout, QGridLayout, QTextEdit, QPushButton, QComboBox, 
+                             QLabel, QProgressBar, QMessageBox,
+                             QFrame, QScrollArea, QGroupBox, QSpinBox)
+from PyQt5.QtCore import (Qt, QMutex, QMutexLocker, QObject, QRunnable, QThread,
+                          QThreadPool, QTimer, pyqtSignal)
 from PyQt5.QtGui import QFont, QPalette, QColor, QIcon
 
-class DownloadThread(QThread):
-    progress = pyqtSignal(int)
-    finished = pyqtSignal(str, bool)
-    error = pyqtSignal(str)
+_URL_SPLIT = re.compile(r'\s*\n\s*')
+_URL_PATTERN = re.compile(r'https?://[^\s]+')
 
-    def __init__(self, url, quality, output_path):
+# Parsed once for the main window; per-row widgets are styled through the
+# object-name selectors below instead of their own setStyleSheet() calls
+_STYLE = """
+    QMainWindow {
+        background-color: #2b2b2b;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #555;
+        border-radius: 8px;
+        margin-top: 1ex;
+        padding-top: 10px;
+        background-color: #3c3c3c;
+        color: #fff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #6bb5ff;
+    }
+    QTextEdit, QComboBox, QPushButton, QLabel {
+        font-size: 12px;
+        border-radius: 4px;
+    }
+    QTextEdit {
+        background-color: #3c3c3c;
+        color: #fff;
+        border: 1px solid #555;
+        padding: 5px;
+    }
+    QComboBox {
+        background-color: #3c3c3c;
+        color: #fff;
+        border: 1px solid #555;
+        padding: 5px;
+        min-width: 100px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #3c3c3c;
+        color: #fff;
+        selection-background-color: #6bb5ff;
+    }
+    QPushButton {
+        background-color: #6bb5ff;
+        color: #fff;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #5aa0e6;
+    }
+    QPushButton:pressed {
+        background-color: #4a8bcb;
+    }
+    QPushButton:disabled {
+        background-color: #555;
+        color: #999;
+    }
+    QLabel {
+        color: #fff;
+        padding: 5px;
+    }
+    QSpinBox {
+        background-color: #3c3c3c;
+        color: #fff;
+        border: 1px solid #555;
+        padding: 5px;
+        font-size: 12px;
+        border-radius: 4px;
+    }
+    QProgressBar {
+        border: 1px solid #555;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #3c3c3c;
+        color: #fff;
+    }
+    QProgressBar::chunk {
+        background-color: #6bb5ff;
+        width: 10px;
+    }
+    #pathLabel {
+        background-color: #3c3c3c;
+        color: #fff;
+        padding: 5px;
+    }
+    #dlUrl {
+        color: #fff;
+    }
+    #dlStatus[state="pending"] {
+        color: #ffa500;
+    }
+    #dlStatus[state="completed"] {
+        color: #4caf50;
+    }
+    #dlStatus[state="cancelled"], #dlStatus[state="error"] {
+        color: #ff6b6b;
+    }
+    #dlCancel {
+        background-color: #ff6b6b;
+    }
+    #dlCancel:hover {
+        background-color: #ff5252;
+    }
+"""
+
+
+# Map quality to format selection
+_FORMAT_MAP = {
+    '360p': 'best[height<=360]',
+    '480p': 'best[height<=480]',
+    '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]',
+    'Best Available': 'best'
+}
+
+# Options shared by every download; build_ydl_opts() adds the per-run ones
+_BASE_YDL_OPTS = {
+    'noplaylist': True,
+    'quiet': True,
+    'no_warnings': False,
+    # Split plain HTTP downloads into ranged chunks to get past
+    # per-connection throttling
+    'http_chunk_size': 10 << 20,
+    'retries': 3,
+    'fragment_retries': 3,
+    'socket_timeout': 15,
+    'nooverwrites': True,
+    # Cap each ffmpeg mux at a share of the cores; muxes also run one at a
+    # time, see _POSTPROCESS_LOCK
+    'postprocessor_args': {'ffmpeg': ['-threads', str(max(2, (os.cpu_count() or 1) // 4))]},
+}
+
+# Held for the duration of each post-processing step (ffmpeg merge etc.) so
+# downloads finishing together don't start several CPU- and disk-heavy
+# ffmpeg processes at once
+_POSTPROCESS_LOCK = threading.Semaphore(1)
+
+
+def build_ydl_opts(quality, output_path, fragment_workers=8):
+    return {
+        **_BASE_YDL_OPTS,
+        'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
+        'format': _FORMAT_MAP.get(quality, 'best'),
+        # Fetch HLS/DASH fragments in parallel
+        'concurrent_fragment_downloads': fragment_workers,
+        # Skip videos already fetched into this directory on an earlier run
+        'download_archive': os.path.join(output_path, '.yt_dlp_archive.txt'),
+    }
+
+
+def warm_up_yt_dlp():
+    # Imported only for its side effect of loading the extractors
+    importlib.import_module('yt_dlp')
+
+
+class YoutubeDLSession:
+    """A long-lived YoutubeDL whose progress hooks are swapped per job."""
+
+    def __init__(self, ydl_opts):
+        # yt_dlp loads its extractors on import, so it is only pulled in once
+        # the window is up (see warm_up_yt_dlp)
+        import yt_dlp
+        
+        self.hook = None
+        self.postprocessor_hook = None
+        self.ydl = yt_dlp.YoutubeDL({**ydl_opts,
+                                     'progress_hooks': [self._relay_progress],
+                                     'postprocessor_hooks': [self._relay_postprocessor]})
+
+    def _relay_progress(self, d):
+        if self.hook is not None:
+            self.hook(d)
+
+    def _relay_postprocessor(self, d):
+        if self.postprocessor_hook is not None:
+            self.postprocessor_hook(d)
+
+
+class YoutubeDLPool:
+    """Keeps idle YoutubeDL sessions alive between jobs.
+
+    YoutubeDL is not thread-safe, so a session is handed to one job at a
+    time. Reusing it keeps its cookiejar and keep-alive connections warm, so
+    later downloads with the same settings skip the DNS/TCP/TLS setup.
+    Only sessions for the most recent settings are kept; switching folder,
+    quality or fragment count closes the rest.
+    """
+
+    def __init__(self):
+        self._mutex = QMutex()
+        self._idle = {}
+        self._key = None
+        # download_archive path -> the one set of recorded ids every session
+        # writing to that file shares
+        self._archives = {}
+
+    def acquire(self, ydl_opts):
+        key = repr(sorted(ydl_opts.items()))
+        stale = []
+        with QMutexLocker(self._mutex):
+            if key != self._key:
+                self._key = key
+                stale = [session for idle in self._idle.values() for session in idle]
+                self._idle.clear()
+            sessions = self._idle.get(key)
+            if sessions:
+                return key, sessions.pop()
+        for session in stale:
+            session.ydl.close()
+        session = YoutubeDLSession(ydl_opts)
+        self._share_archive(session, ydl_opts.get('download_archive'))
+        return key, session
+
+    def _share_archive(self, session, path):
+        # YoutubeDL reads the archive file only when it is created and then
+        # checks its own in-memory set, so without sharing, a long-lived
+        # session would never see ids recorded by the other sessions
+        if path is None:
+            return
+        with QMutexLocker(self._mutex):
+            archive = self._archives.get(path)
+            if archive is None:
+                self._archives[path] = session.ydl.archive
+            else:
+                archive.update(session.ydl.archive)
+                session.ydl.archive = archive
+
+    def release(self, key, session):
+        session.hook = None
+        session.postprocessor_hook = None
+        with QMutexLocker(self._mutex):
+            if key == self._key:
+                self._idle.setdefault(key, []).append(session)
+                return
+        # Finished after a run with other settings started; nobody reuses it
+        session.ydl.close()
+
+    def close(self):
+        with QMutexLocker(self._mutex):
+            sessions = [session for idle in self._idle.values() for session in idle]
+            self._idle.clear()
+        for session in sessions:
+            session.ydl.close()
+
+
+class InfoPrefetcher(QObject):
+    """Resolves video metadata ahead of the downloads on an asyncio loop.
+
+    Extraction is latency-bound (page fetch, player JS) while the download
+    itself is bandwidth-bound, so the two run as separate stages: the loop
+    thread fans every URL out to a small extraction executor, and download
+    jobs wait on the result for their URL before fetching any bytes.
+    """
+    resolved = pyqtSignal(int, str)
+
+    def __init__(self, ydl_pool, max_workers=8):
         super().__init__()
-        self.url = url
-        self.quality = quality
-        self.output_path = output_path
+        self.ydl_pool = ydl_pool
+        self._futures = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, job_id, url, ydl_opts):
+        future = asyncio.run_coroutine_threadsafe(self._resolve(job_id, url, ydl_opts), self._loop)
+        self._futures[job_id] = future
+
+    async def _resolve(self, job_id, url, ydl_opts):
+        loop = asyncio.get_running_loop()
+        info = await loop.run_in_executor(self._executor, self._extract, url, ydl_opts)
+        if info is not None:
+            self.resolved.emit(job_id, info.get('title') or url)
+        return info
+
+    def _extract(self, url, ydl_opts):
+        key, session = self.ydl_pool.acquire(ydl_opts)
+        try:
+            return session.ydl.extract_info(url, download=False)
+        finally:
+            self.ydl_pool.release(key, session)
+
+    def result(self, job_id):
+        """Block until the metadata for job_id is resolved and return it.
+
+        Returns None if the URL was never submitted or yt_dlp skipped it;
+        extraction errors are raised to the caller.
+        """
+        future = self._futures.pop(job_id, None)
+        if future is None:
+            return None
+        return future.result()
+
+    def discard(self, job_id):
+        """Drop the lookup for a cancelled job.
+
+        An extraction still queued on the executor is skipped; one already
+        running finishes, but its result is thrown away.
+        """
+        future = self._futures.pop(job_id, None)
+        if future is not None:
+            future.cancel()
+
+    def cancel_pending(self):
+        futures, self._futures = self._futures, {}
+        for future in futures.values():
+            future.cancel()
+
+    def close(self):
+        self.cancel_pending()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+
+class EmitInterval:
+    """Minimum time between progress signals, shared by all download jobs.
+
+    The GUI raises it while many downloads are in flight and lowers it when
+    only a few are, so the total rate of progress events stays bounded.
+    Plain attribute reads and writes are atomic under the GIL.
+    """
+
+    def __init__(self, ms=100):
+        self._ms = ms
+
+    def seconds(self):
+        return self._ms / 1000.0
+
+    def set_ms(self, ms):
+        self._ms = ms
+
+
+class DownloadQueue:
+    """The (job_id, url) pairs of one run, shared by all its workers.
+
+    Workers pull the next URL when they finish the previous one, so a long
+    video only holds up its own worker. The worker count follows the
+    "Concurrent downloads" setting while the run is going.
+    """
+
+    def __init__(self, jobs=()):
+        self._lock = threading.Lock()
+        self._jobs = deque(jobs)
+        self._workers = 0
+        self.max_workers = 0
         self.is_cancelled = False
+        self.cancelled_jobs = set()
+
+    def add_workers(self, max_workers):
+        """Set the worker limit and return how many new workers to start."""
+        with self._lock:
+            self.max_workers = max_workers
+            count = max(0, min(max_workers, self._workers + len(self._jobs)) - self._workers)
+            self._workers += count
+            return count
+
+    def claim(self):
+        """Return the next (job_id, url), or None when the worker should stop."""
+        with self._lock:
+            if not self._jobs or self._workers > self.max_workers:
+                self._workers -= 1
+                return None
+            return self._jobs.popleft()
+
+    def job_cancelled(self, job_id):
+        return self.is_cancelled or job_id in self.cancelled_jobs
+
+    def cancel(self, job_id=None):
+        if job_id is None:
+            self.is_cancelled = True
+        else:
+            self.cancelled_jobs.add(job_id)
+
+
+class DownloadSignals(QObject):
+    # QRunnable is not a QObject, so the job emits through this companion.
+    # Every signal carries the integer job id of the row it belongs to, so one
+    # job can drive several progress rows.
+    # Sizes are in KiB: QProgressBar ranges are 32-bit ints, which byte
+    # counts overflow past 2 GiB
+    total = pyqtSignal(int, int)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(int, bool)
+    error = pyqtSignal(int, str)
+
+
+class DownloadThread(QRunnable):
+    def __init__(self, queue, ydl_opts, ydl_pool, prefetcher, emit_interval):
+        super().__init__()
+        self.queue = queue
+        self.ydl_opts = ydl_opts
+        self.ydl_pool = ydl_pool
+        self.prefetcher = prefetcher
+        self.emit_interval = emit_interval
+        self.current_job_id = None
+        self._last_emit = 0.0
+        self._last_value = -1
+        self._last_total = 0
+        self._holds_postprocess = False
+        self.done = False
+        self.signals = DownloadSignals()
+        # Keep ownership on the Python side so the signals outlive run(); the
+        # window holds a reference until `done` is set
+        self.setAutoDelete(False)
 
     def run(self):
+        # One pooled YoutubeDL instance serves every URL this worker takes, so
+        # extractor setup, the cookiejar and open connections are shared
+        # between URLs and survive into the next run with the same settings
+        key, session = self.ydl_pool.acquire(self.ydl_opts)
+        session.hook = self.progress_hook
+        session.postprocessor_hook = self.postprocessor_hook
+        ydl = session.ydl
         try:
-            # Map quality to format selection
-            format_map = {
-                '360p': 'best[height<=360]',
-                '480p': 'best[height<=480]',
-                '720p': 'best[height>=720]',
-                'Best Available': 'best'
-            }
-            
-            ydl_opts = {
-                'outtmpl': os.path.join(self.output_path, '%(title)s.%(ext)s'),
-                'format': format_map.get(self.quality, 'best'),
-                'noplaylist': True,
-                'quiet': True,
-                'no_warnings': False,
-                'progress_hooks': [self.progress_hook],
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([self.url])
-                
-            if not self.is_cancelled:
-                self.finished.emit(self.url, True)
+            while True:
+                job = self.queue.claim()
+                if job is None:
+                    break
+                job_id, url = job
+                self.current_job_id = job_id
+                self._last_emit = 0.0
+                self._last_value = -1
+                self._last_total = 0
+                if self.queue.job_cancelled(job_id):
+                    self.prefetcher.discard(job_id)
+                    self.signals.finished.emit(job_id, False)
+                    continue
                 
-        except Exception as e:
-            if not self.is_cancelled:
-                self.error.emit(str(e))
+                try:
+                    # Wait for the extraction stage, then only fetch bytes here
+                    info = self.prefetcher.result(job_id)
+                    if self.queue.job_cancelled(job_id):
+                        # Cancelled while waiting; a discarded lookup also
+                        # returns None, which must not re-extract the page
+                        self.signals.finished.emit(job_id, False)
+                        continue
+                    if info is not None:
+                        ydl.process_ie_result(info, download=True)
+                    else:
+                        ydl.download([url])
+                    self.signals.finished.emit(job_id, not self.queue.job_cancelled(job_id))
+                except Exception as e:
+                    if self.queue.job_cancelled(job_id):
+                        self.signals.finished.emit(job_id, False)
+                    else:
+                        self.signals.error.emit(job_id, str(e))
+                finally:
+                    # A failing post-processor never reports 'finished'
+                    self._release_postprocess()
+        finally:
+            self.ydl_pool.release(key, session)
+            self.done = True
 
     def progress_hook(self, d):
+        job_id = self.current_job_id
+        if self.queue.job_cancelled(job_id):
+            from yt_dlp.utils import DownloadCancelled
+            raise DownloadCancelled()
+            
         if d['status'] == 'downloading':
-            if 'total_bytes' in d and d['total_bytes'] > 0:
-                percent = int(float(d['downloaded_bytes']) / float(d['total_bytes']) * 100)
-                self.progress.emit(percent)
-            elif 'downloaded_bytes' in d and d.get('total_bytes_estimate'):
-                percent = int(float(d['downloaded_bytes']) / float(d['total_bytes_estimate']) * 100)
-                self.progress.emit(percent)
+            # Send the bar its range once per file and then raw counters, so
+            # no float math runs per chunk and Qt can drop no-op updates
+            downloaded_kib = d['downloaded_bytes'] >> 10
+            exact = d.get('total_bytes')
+            total = exact or d.get('total_bytes_estimate')
+            if total:
+                total_kib = max(1, int(total) >> 10)
+                # Fragmented (HLS/DASH) estimates shift on every fragment, so
+                # only resize the bar once they drift by more than ~5% or the
+                # download has outgrown the current range
+                changed = total_kib != self._last_total
+                if changed and not exact:
+                    changed = (abs(total_kib - self._last_total) * 20
+                               > self._last_total
+                               or downloaded_kib > self._last_total)
+                if changed:
+                    self._last_total = total_kib
+                    self.signals.total.emit(job_id, total_kib)
+                self._emit_progress(job_id, downloaded_kib)
+        elif d['status'] == 'finished':
+            # Without a known size the bar still has its default 0-100 range
+            self._last_value = self._last_total or 100
+            self.signals.progress.emit(job_id, self._last_value)
+
+    def postprocessor_hook(self, d):
+        if d['status'] == 'started':
+            _POSTPROCESS_LOCK.acquire()
+            self._holds_postprocess = True
         elif d['status'] == 'finished':
-            self.progress.emit(100)
+            self._release_postprocess()
 
-    def cancel(self):
-        self.is_cancelled = True
+    def _release_postprocess(self):
+        if self._holds_postprocess:
+            self._holds_postprocess = False
+            _POSTPROCESS_LOCK.release()
+
+    def _emit_progress(self, job_id, value):
+        # The hook fires for every received chunk; coalesce to one update per
+        # emit interval and skip repeats so the GUI thread isn't flooded
+        now = time.monotonic()
+        if value != self._last_value and now - self._last_emit >= self.emit_interval.seconds():
+            self._last_emit = now
+            self._last_value = value
+            self.signals.progress.emit(job_id, value)
 
 
 class YouTubeDownloader(QMainWindow):
     def __init__(self):
         super().__init__()
         self.download_threads = []
+        self._queue = DownloadQueue()
+        self._default_dir = os.path.expanduser("~/Downloads")
+        # job_id -> (progress_bar, status_label, cancel_button)
+        self._jobs = {}
+        self._next_job_id = 0
+        # Grid rows are kept in order and reused between runs;
+        # the first _rows_used of them belong to the current run
+        self._row_pool = []
+        self._rows_used = 0
+        self._pending_jobs = []
+        self._active = 0
+        # Finished jobs per outcome: 'completed', 'cancelled' or 'error'
+        self._status = Counter()
+        self._total = 0
+        
+        # Downloads are network-bound, so a small bounded pool beats one thread per URL
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(2, min(8, QThread.idealThreadCount())))
+        self.ydl_pool = YoutubeDLPool()
+        self.prefetcher = InfoPrefetcher(self.ydl_pool)
+        self.emit_interval = EmitInterval()
+        self.prefetcher.resolved.connect(self.info_resolved, Qt.QueuedConnection)
         self.initUI()
+        
+        # Progress rows are built a few per event-loop tick
+        self._row_timer = QTimer(self)
+        self._row_timer.setSingleShot(True)
+        self._row_timer.setInterval(0)
+        self._row_timer.timeout.connect(self.add_pending_rows)
+        
+        # Import yt_dlp in the background so the window shows immediately
+        # and the first download doesn't pay for the import either
+        threading.Thread(target=warm_up_yt_dlp, daemon=True).start()
 
     def initUI(self):
         self.setWindowTitle('YouTube Video Downloader')
         self.setGeometry(100, 100, 800, 600)
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                background-color: #3c3c3c;
-                color: #fff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #6bb5ff;
-            }
-            QTextEdit, QComboBox, QPushButton, QLabel {
-                font-size: 12px;
-                border-radius: 4px;
-            }
-            QTextEdit {
-                background-color: #3c3c3c;
-                color: #fff;
-                border: 1px solid #555;
-                padding: 5px;
-            }
-            QComboBox {
-                background-color: #3c3c3c;
-                color: #fff;
-                border: 1px solid #555;
-                padding: 5px;
-                min-width: 100px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3c3c3c;
-                color: #fff;
-                selection-background-color: #6bb5ff;
-            }
-            QPushButton {
-                background-color: #6bb5ff;
-                color: #fff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5aa0e6;
-            }
-            QPushButton:pressed {
-                background-color: #4a8bcb;
-            }
-            QPushButton:disabled {
-                background-color: #555;
-                color: #999;
-            }
-            QLabel {
-                color: #fff;
-                padding: 5px;
-            }
-            QProgressBar {
-                border: 1px solid #555;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #3c3c3c;
-                color: #fff;
-            }
-            QProgressBar::chunk {
-                background-color: #6bb5ff;
-                width: 10px;
-            }
-        """)
+        self.setStyleSheet(_STYLE)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -178,13 +601,34 @@ class YouTubeDownloader(QMainWindow):
         quality_layout.addWidget(self.quality_combo)
         settings_layout.addLayout(quality_layout)
         
+        # Concurrency selection
+        concurrency_layout = QVBoxLayout()
+        concurrency_label = QLabel("Concurrent downloads:")
+        self.concurrency_combo = QComboBox()
+        self.concurrency_combo.addItems([str(n) for n in range(1, 9)])
+        self.concurrency_combo.setCurrentText(str(self.pool.maxThreadCount()))
+        self.concurrency_combo.currentTextChanged.connect(self.set_concurrency)
+        concurrency_layout.addWidget(concurrency_label)
+        concurrency_layout.addWidget(self.concurrency_combo)
+        settings_layout.addLayout(concurrency_layout)
+        
+        # Fragment worker selection
+        fragments_layout = QVBoxLayout()
+        fragments_label = QLabel("Fragment workers:")
+        self.fragments_spinbox = QSpinBox()
+        self.fragments_spinbox.setRange(1, 16)
+        self.fragments_spinbox.setValue(8)
+        fragments_layout.addWidget(fragments_label)
+        fragments_layout.addWidget(self.fragments_spinbox)
+        settings_layout.addLayout(fragments_layout)
+        
         # Path selection
         path_layout = QVBoxLayout()
         path_label = QLabel("Download Path:")
         path_selector_layout = QHBoxLayout()
-        self.path_label = QLabel(os.path.expanduser("~/Downloads"))
+        self.path_label = QLabel(self._default_dir)
         self.path_label.setFrameStyle(QFrame.Panel | QFrame.Sunken)
-        self.path_label.setStyleSheet("background-color: #3c3c3c; color: #fff; padding: 5px;")
+        self.path_label.setObjectName("pathLabel")
         self.browse_button = QPushButton("Browse")
         self.browse_button.clicked.connect(self.browse_path)
         path_selector_layout.addWidget(self.path_label)
@@ -203,7 +647,10 @@ class YouTubeDownloader(QMainWindow):
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.progress_widget = QWidget()
-        self.progress_layout = QVBoxLayout(self.progress_widget)
+        # One grid for every row: url | progress | status | cancel
+        self.progress_layout = QGridLayout(self.progress_widget)
+        self.progress_layout.setColumnStretch(1, 1)
+        self.progress_layout.setAlignment(Qt.AlignTop)
         self.scroll_area.setWidget(self.progress_widget)
         
         progress_layout.addWidget(self.scroll_area)
@@ -221,114 +668,247 @@ class YouTubeDownloader(QMainWindow):
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
 
+    def closeEvent(self, event):
+        self.cancel_all()
+        self.pool.waitForDone()
+        self.prefetcher.close()
+        self.ydl_pool.close()
+        super().closeEvent(event)
+
+    def set_concurrency(self, text):
+        self.pool.setMaxThreadCount(int(text))
+        # Apply to a running batch too: extra workers start now, surplus ones
+        # stop after their current URL
+        if self._queue.max_workers:
+            self.start_workers()
+            self.update_emit_interval()
+
     def browse_path(self):
+        from PyQt5.QtWidgets import QFileDialog
         path = QFileDialog.getExistingDirectory(self, "Select Download Directory", self.path_label.text())
         if path:
             self.path_label.setText(path)
 
     def start_download(self):
-        urls = self.url_textedit.toPlainText().strip().split('\n')
-        if not urls or not urls[0]:
+        text = self.url_textedit.toPlainText().strip()
+        urls = [url for url in _URL_SPLIT.split(text) if url]
+        if not urls:
             QMessageBox.warning(self, "Input Error", "Please enter at least one YouTube URL")
             return
-            
-        quality = self.quality_combo.currentText()
-        output_path = self.path_label.text()
         
-        # Create output directory if it doesn't exist
-        if not os.path.exists(output_path):
-            os.makedirs(output_path)
+        # Drop malformed lines before any extractor gets to waste a lookup on them
+        valid = [url for url in urls if _URL_PATTERN.fullmatch(url)]
+        if len(valid) < len(urls):
+            if not valid:
+                QMessageBox.warning(self, "Input Error", "Please enter at least one valid http(s) URL")
+                return
+            invalid = [url for url in urls if not _URL_PATTERN.fullmatch(url)]
+            QMessageBox.warning(self, "Input Error", 
+                                f"Skipping {len(invalid)} invalid URL(s):\n" + "\n".join(invalid[:10]))
+        # Pasting the same URL twice should not download it twice
+        urls = list(dict.fromkeys(valid))
         
-        # Clear previous progress widgets
-        for i in reversed(range(self.progress_layout.count())): 
-            self.progress_layout.itemAt(i).widget().setParent(None)
+        # Resolve the directory once so yt_dlp gets a normalized absolute
+        # path, and create it in a single call without a separate exists() check
+        output_path = str(Path(self.path_label.text()).expanduser().resolve())
+        os.makedirs(output_path, exist_ok=True)
+        ydl_opts = build_ydl_opts(self.quality_combo.currentText(), output_path,
+                                  self.fragments_spinbox.value())
         
-        self.download_threads = []
-        for url in urls:
-            if url.strip():
-                self.add_download_item(url.strip(), quality, output_path)
+        # Hide the previous rows; they are reset and reused below
+        for row in self._row_pool[:self._rows_used]:
+            for widget in row:
+                widget.hide()
+        self._rows_used = 0
+        
+        # Job ids keep increasing across runs, so late signals from a previous
+        # run never match a row of the current one
+        self._jobs = {}
+        self._active = 0
+        self._status = Counter()
+        self._total = 0
+        self._pending_jobs = list(zip(range(self._next_job_id, self._next_job_id + len(urls)), urls))
+        self._next_job_id += len(urls)
+        
+        # Workers pull from one shared queue; they are started once every row
+        # exists, see dispatch_downloads()
+        self._queue = DownloadQueue(self._pending_jobs)
+        self._pending_opts = ydl_opts
+        self._row_timer.start()
         
         self.download_button.setEnabled(False)
         self.cancel_button.setEnabled(True)
 
-    def add_download_item(self, url, quality, output_path):
-        frame = QFrame()
-        frame.setFrameStyle(QFrame.Box)
-        frame.setStyleSheet("QFrame { background-color: #3c3c3c; border-radius: 4px; }")
-        layout = QHBoxLayout(frame)
+    def add_pending_rows(self):
+        # Build at most 10 rows per tick so a long URL list doesn't freeze the
+        # window, then queue the downloads once every row is in place
+        # Suspend painting so the grid is laid out once per batch, not per row
+        end = min(self._rows_used + 10, len(self._pending_jobs))
+        self.progress_widget.setUpdatesEnabled(False)
+        for job_id, url in self._pending_jobs[self._rows_used:end]:
+            self.add_download_item(job_id, url)
+        self.progress_widget.setUpdatesEnabled(True)
+        
+        if self._rows_used < len(self._pending_jobs):
+            self._row_timer.start()
+        else:
+            self.dispatch_downloads()
+
+    def dispatch_downloads(self):
+        # Resolve metadata for every URL up front, in the order the batches
+        # will need it, while the downloads wait for their first result
+        self.prefetcher.cancel_pending()
+        if not self._queue.is_cancelled:
+            for job_id, url in self._pending_jobs:
+                self.prefetcher.submit(job_id, url, self._pending_opts)
+        
+        self.update_emit_interval()
+        self.start_workers()
+
+    def start_workers(self):
+        # A worker may still be queued behind a cancelled run, so only drop
+        # the ones whose run() has returned; the pool doesn't own them
+        self.download_threads = [thread for thread in self.download_threads if not thread.done]
+        for _ in range(self._queue.add_workers(self.pool.maxThreadCount())):
+            thread = DownloadThread(self._queue, self._pending_opts, self.ydl_pool, self.prefetcher,
+                                    self.emit_interval)
+            thread.signals.total.connect(self.download_total, Qt.QueuedConnection)
+            thread.signals.progress.connect(self.download_progress, Qt.QueuedConnection)
+            thread.signals.finished.connect(self.download_finished, Qt.QueuedConnection)
+            thread.signals.error.connect(self.download_error, Qt.QueuedConnection)
+            self.download_threads.append(thread)
+            self.pool.start(thread)
+
+    def update_emit_interval(self):
+        # Each worker downloads one URL at a time, so at most one per pool
+        # slot is in flight; throttle harder the more of them report progress
+        in_flight = min(self._active, self.pool.maxThreadCount())
+        self.emit_interval.set_ms(max(50, 500 // max(1, 8 - in_flight)))
+
+    def add_download_item(self, job_id, url):
+        if self._rows_used < len(self._row_pool):
+            row = self._row_pool[self._rows_used]
+        else:
+            row = self.create_row()
+            self._row_pool.append(row)
+        self._rows_used += 1
+        url_label, progress_bar, status_label, cancel_button = row
         
         # URL label (shortened for display)
         display_url = url[:50] + "..." if len(url) > 50 else url
-        url_label = QLabel(display_url)
+        url_label.setText(display_url)
         url_label.setToolTip(url)
-        url_label.setStyleSheet("color: #fff;")
+        
+        progress_bar.setRange(0, 100)
+        progress_bar.setValue(0)
+        self.set_status(status_label, "Pending", "pending")
+        status_label.setToolTip("")
+        cancel_button.setProperty("job_id", job_id)
+        cancel_button.setEnabled(True)
+        for widget in row:
+            widget.show()
+        
+        self._jobs[job_id] = row
+        self._active += 1
+        self._total += 1
+
+    def create_row(self):
+        row = len(self._row_pool)
+        
+        # URL label
+        url_label = QLabel()
+        url_label.setObjectName("dlUrl")
         url_label.setMinimumWidth(200)
-        layout.addWidget(url_label)
+        self.progress_layout.addWidget(url_label, row, 0)
         
         # Progress bar
         progress_bar = QProgressBar()
-        progress_bar.setValue(0)
-        layout.addWidget(progress_bar)
+        progress_bar.setFormat("%p%")
+        self.progress_layout.addWidget(progress_bar, row, 1)
         
         # Status label
-        status_label = QLabel("Pending")
-        status_label.setStyleSheet("color: #ffa500;")  # Orange for pending
-        layout.addWidget(status_label)
+        status_label = QLabel()
+        status_label.setObjectName("dlStatus")
+        self.progress_layout.addWidget(status_label, row, 2)
         
         # Cancel button for individual download
         cancel_button = QPushButton("Cancel")
-        cancel_button.setStyleSheet("QPushButton { background-color: #ff6b6b; } QPushButton:hover { background-color: #ff5252; }")
-        layout.addWidget(cancel_button)
-        
-        self.progress_layout.addWidget(frame)
-        
-        # Create and start download thread
-        thread = DownloadThread(url, quality, output_path)
-        thread.progress.connect(progress_bar.setValue)
-        thread.finished.connect(lambda url, success: self.download_finished(url, success, status_label, cancel_button))
-        thread.error.connect(lambda error: self.download_error(url, error, status_label, cancel_button))
+        cancel_button.setObjectName("dlCancel")
+        cancel_button.clicked.connect(self.cancel_item)
+        self.progress_layout.addWidget(cancel_button, row, 3)
         
-        cancel_button.clicked.connect(thread.cancel)
-        
-        self.download_threads.append(thread)
-        thread.start()
+        return url_label, progress_bar, status_label, cancel_button
+
+    def cancel_item(self):
+        job_id = self.sender().property("job_id")
+        self._queue.cancel(job_id)
+        self.prefetcher.discard(job_id)
+
+    def info_resolved(self, job_id, title):
+        row = self._jobs.get(job_id)
+        if row is not None:
+            display_title = title[:50] + "..." if len(title) > 50 else title
+            row[0].setText(display_title)
 
-    def download_finished(self, url, success, status_label, cancel_button):
+    def download_total(self, job_id, total):
+        row = self._jobs.get(job_id)
+        if row is not None:
+            row[1].setRange(0, total)
+
+    def download_progress(self, job_id, value):
+        row = self._jobs.get(job_id)
+        if row is not None:
+            row[1].setValue(value)
+
+    def download_finished(self, job_id, success):
+        if job_id not in self._jobs:
+            return
+        url_label, progress_bar, status_label, cancel_button = self._jobs[job_id]
         if success:
-            status_label.setText("Completed")
-            status_label.setStyleSheet("color: #4caf50;")  # Green for success
+            self._status['completed'] += 1
+            self.set_status(status_label, "Completed", "completed")
         else:
-            status_label.setText("Cancelled")
-            status_label.setStyleSheet("color: #ff6b6b;")  # Red for cancelled
+            self._status['cancelled'] += 1
+            self.set_status(status_label, "Cancelled", "cancelled")
         
         cancel_button.setEnabled(False)
+        self._active -= 1
+        self.update_emit_interval()
         self.check_all_finished()
 
-    def download_error(self, url, error, status_label, cancel_button):
-        status_label.setText("Error")
-        status_label.setStyleSheet("color: #ff6b6b;")  # Red for error
+    def download_error(self, job_id, error):
+        if job_id not in self._jobs:
+            return
+        url_label, progress_bar, status_label, cancel_button = self._jobs[job_id]
+        self._status['error'] += 1
+        self.set_status(status_label, "Error", "error")
         status_label.setToolTip(error)
         cancel_button.setEnabled(False)
+        self._active -= 1
+        self.update_emit_interval()
         self.check_all_finished()
 
+    def set_status(self, status_label, text, state):
+        # Re-polish so the [state=...] selector in _STYLE picks up the change
+        status_label.setText(text)
+        status_label.setProperty("state", state)
+        status_label.style().unpolish(status_label)
+        status_label.style().polish(status_label)
+
     def check_all_finished(self):
-        all_finished = all(not thread.isRunning() for thread in self.download_threads)
-        if all_finished:
+        if self._active == 0:
             self.download_button.setEnabled(True)
             self.cancel_button.setEnabled(False)
             
             # Show completion message
-            completed = sum(1 for i in range(self.progress_layout.count()) 
-                           if self.progress_layout.itemAt(i).widget().layout().itemAt(2).widget().text() == "Completed")
-            total = self.progress_layout.count()
-            
+            completed = self._status['completed']
             if completed > 0:
                 QMessageBox.information(self, "Download Complete", 
-                                      f"Successfully downloaded {completed} of {total} videos.")
+                                      f"Successfully downloaded {completed} of {self._total} videos.")
 
     def cancel_all(self):
-        for thread in self.download_threads:
-            thread.cancel()
+        self.prefetcher.cancel_pending()
+        self._queue.cancel()
         self.cancel_button.setEnabled(False)
         self.download_button.setEnabled(True)
 